@@ -0,0 +1,448 @@
+"""
+This module benchmarks JSDValidator and JSDDiff on synthetic schemas.
+
+Schemas are generated along several axes (deep nesting, wide properties,
+many $refs and file size), written to a temporary directory and run through
+load, check_schema and diff. Results are saved as JSON and two runs can be
+compared to flag regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/file")),
+)
+from jsd_diff import JSDDiff
+from jsd_profile import StageProfiler
+from jsd_validator import JSDValidator
+
+DEFAULT_LEVELS = {
+    "depth": [50, 100, 150, 200, 400],
+    "width": [10, 1000, 10000],
+    "refs": [10, 1000, 10000],
+    "size": [1024, 1024 * 1024, 10 * 1024 * 1024, 50 * 1024 * 1024],
+}
+DEFAULT_COUNTS = [1, 10]
+
+
+def deep_schema(depth):
+    """
+    Generate a schema with ``depth`` levels of nested object properties.
+    """
+    schema = {"type": "string"}
+    for level in range(depth):
+        schema = {
+            "type": "object",
+            "properties": {f"level_{level}": schema},
+            "required": [f"level_{level}"],
+        }
+    return schema
+
+
+def wide_schema(width):
+    """
+    Generate a schema with ``width`` properties on a single object.
+    """
+    return {
+        "type": "object",
+        "properties": {
+            f"field_{index}": {"type": "string", "maxLength": 255}
+            for index in range(width)
+        },
+    }
+
+
+def refs_schema(count):
+    """
+    Generate a schema with ``count`` definitions, each used through a $ref.
+    """
+    return {
+        "type": "object",
+        "definitions": {
+            f"def_{index}": {"type": "integer", "minimum": index}
+            for index in range(count)
+        },
+        "properties": {
+            f"field_{index}": {"$ref": f"#/definitions/def_{index}"}
+            for index in range(count)
+        },
+    }
+
+
+def sized_schema(size_bytes):
+    """
+    Generate a schema of roughly ``size_bytes`` bytes when serialized.
+    """
+    description = "x" * 200
+    field = {"type": "string", "description": description}
+    field_bytes = len(json.dumps({"field_000000": field}, indent=4))
+    return {
+        "type": "object",
+        "properties": {
+            f"field_{index:06d}": dict(field)
+            for index in range(max(1, size_bytes // field_bytes))
+        },
+    }
+
+
+GENERATORS = {
+    "depth": deep_schema,
+    "width": wide_schema,
+    "refs": refs_schema,
+    "size": sized_schema,
+}
+
+
+def write_case(directory, axis, level, count):
+    """
+    Write ``count`` pairs of source and destination schemas for a case.
+
+    Each destination differs from its source by one root keyword so that
+    every diff has output.
+
+    Returns:
+    -------
+    tuple
+        The list of (source_path, destination_path) pairs and the size in
+        bytes of one source schema.
+    """
+    schema = GENERATORS[axis](level)
+    source_text = json.dumps(schema, indent=4)
+    destination_text = json.dumps(dict(schema, description="changed"), indent=4)
+    pairs = []
+    for index in range(count):
+        source_path = os.path.join(directory, f"{axis}_{level}_{index}_source.jsd")
+        destination_path = os.path.join(
+            directory, f"{axis}_{level}_{index}_destination.jsd"
+        )
+        with open(source_path, "w") as file:
+            file.write(source_text)
+        with open(destination_path, "w") as file:
+            file.write(destination_text)
+        pairs.append((source_path, destination_path))
+    return pairs, len(source_text.encode("utf-8"))
+
+
+def run_pairs(pairs, profiler):
+    """
+    Validate and diff every pair, recording stages on ``profiler``.
+    """
+    profiler.start()
+    try:
+        for source_path, destination_path in pairs:
+            validator = JSDValidator(source_path, profiler)
+            validator.load_jsd()
+            valid, message = validator.validate_jsd()
+            if not valid:
+                raise ValueError(message)
+
+            jsd_diff = JSDDiff(source_path, destination_path, profiler)
+            jsd_diff.source_schema = validator.schema
+            jsd_diff.destination_schema = jsd_diff.load_jsd(destination_path)
+            jsd_diff.perform_diff()
+    finally:
+        profiler.stop()
+
+
+def run_case(axis, level, count, repeat=1, memory=True):
+    """
+    Benchmark one case.
+
+    Timings are the fastest of ``repeat`` runs, taken without tracemalloc so
+    they are not inflated by it. Peak memory is measured in a separate, traced
+    run. If the tooling fails, the timings of the failing run are kept and
+    ``error_stage`` names the stage that raised; failures while generating
+    the schemas have ``error_stage`` "generate".
+
+    Returns:
+    -------
+    dict
+        The case parameters, the schema size, per-stage timings in seconds,
+        peak traced memory in bytes and any error that stopped the case,
+        along with the stage it happened in.
+    """
+    result = {
+        "axis": axis,
+        "level": level,
+        "count": count,
+        "schema_bytes": None,
+        "stages": {},
+        "total_seconds": None,
+        "peak_memory_bytes": None,
+        "error": None,
+        "error_stage": None,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            pairs, result["schema_bytes"] = write_case(directory, axis, level, count)
+        except (RecursionError, MemoryError, ValueError) as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+            result["error_stage"] = "generate"
+            return result
+
+        profiler = None
+        try:
+            for _ in range(repeat):
+                profiler = StageProfiler(enabled=True)
+                run_pairs(pairs, profiler)
+                for name, seconds in profiler.timings.items():
+                    best = result["stages"].get(name)
+                    result["stages"][name] = (
+                        seconds if best is None else min(best, seconds)
+                    )
+            if memory:
+                profiler = StageProfiler(enabled=True, track_memory=True)
+                run_pairs(pairs, profiler)
+                result["peak_memory_bytes"] = profiler.peak_memory_bytes
+        except (RecursionError, MemoryError, ValueError) as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+            result["error_stage"] = profiler.last_stage
+            if not result["stages"]:
+                result["stages"] = dict(profiler.timings)
+        result["total_seconds"] = sum(result["stages"].values())
+    return result
+
+
+def run_benchmarks(levels, counts, repeat=1, memory=True):
+    """
+    Benchmark every combination of axis level and schema count.
+
+    Parameters:
+    ----------
+    levels : dict
+        A mapping of axis name to the list of levels to generate.
+    counts : list of int
+        The numbers of schema pairs to run per case.
+    repeat : int, optional
+        How many timing runs to take the fastest of (default is 1).
+    memory : bool, optional
+        Whether to measure peak memory (default is True).
+
+    Returns:
+    -------
+    dict
+        The run metadata and the list of case results.
+    """
+    cases = []
+    for axis, axis_levels in levels.items():
+        for level in axis_levels:
+            for count in counts:
+                result = run_case(axis, level, count, repeat, memory)
+                print(format_case(result), file=sys.stderr)
+                cases.append(result)
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": cases,
+    }
+
+
+def format_case(result):
+    """
+    Format a case result as a single line.
+    """
+    label = f"{result['axis']}={result['level']} x{result['count']}"
+    stages = " ".join(
+        f"{name}={seconds * 1000:.1f}ms" for name, seconds in result["stages"].items()
+    )
+    line = f"{label:<28} {stages}".rstrip()
+    if result["peak_memory_bytes"] is not None:
+        line += f" peak={result['peak_memory_bytes'] / (1024 * 1024):.1f}MiB"
+    if result["error"]:
+        line += f" failed in {result['error_stage']}: {result['error']}"
+    return line
+
+
+def compare_results(baseline, current, threshold=0.2, min_seconds=0.001):
+    """
+    Compare two benchmark runs and return the regressions.
+
+    A stage or peak memory regresses when it grows by more than ``threshold``
+    relative to the baseline. Timing changes smaller than ``min_seconds`` are
+    ignored as noise. A case that ran in the baseline but errors now, a
+    baseline case missing from the current run and a baseline stage missing
+    from the current case are also regressions.
+
+    Parameters:
+    ----------
+    baseline : dict
+        The results of the earlier run.
+    current : dict
+        The results of the later run.
+    threshold : float, optional
+        The allowed relative growth (default is 0.2, i.e. 20%).
+    min_seconds : float, optional
+        The smallest absolute timing change reported (default is 0.001).
+
+    Returns:
+    -------
+    list
+        One message per regression.
+    """
+
+    def key(case):
+        return case["axis"], case["level"], case["count"]
+
+    baseline_cases = {key(case): case for case in baseline["cases"]}
+    current_keys = {key(case) for case in current["cases"]}
+    regressions = [
+        "{}={} x{}: missing from the current run".format(*case_key)
+        for case_key in baseline_cases
+        if case_key not in current_keys
+    ]
+    for case in current["cases"]:
+        before = baseline_cases.get(key(case))
+        if before is None:
+            continue
+        label = "{}={} x{}".format(*key(case))
+        if case["error"] and not before["error"]:
+            regressions.append(
+                f"{label}: now fails in {case.get('error_stage')} "
+                f"with {case['error']}"
+            )
+            continue
+
+        regressions.extend(
+            f"{label}: {name} missing from the current run"
+            for name in before["stages"]
+            if name not in case["stages"]
+        )
+        measures = [
+            (name, before["stages"].get(name), seconds)
+            for name, seconds in case["stages"].items()
+        ]
+        measures.append(
+            (
+                "peak_memory_bytes",
+                before["peak_memory_bytes"],
+                case["peak_memory_bytes"],
+            )
+        )
+        for name, old, new in measures:
+            if not old or new is None or new <= old * (1 + threshold):
+                continue
+            if name != "peak_memory_bytes" and new - old < min_seconds:
+                continue
+            regressions.append(
+                f"{label}: {name} {old:.6g} -> {new:.6g} (x{new / old:.2f})"
+            )
+    return regressions
+
+
+def parse_size(value):
+    """
+    Parse a size such as ``512``, ``1KB`` or ``50MB`` into bytes.
+    """
+    units = {"KB": 1024, "MB": 1024 * 1024, "GB": 1024 * 1024 * 1024}
+    value = value.strip().upper()
+    for unit, factor in units.items():
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)]) * factor)
+    return int(value)
+
+
+def parse_list(value, parse=int):
+    """
+    Parse a comma separated list of values.
+    """
+    return [parse(item) for item in value.split(",") if item.strip()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark JSD validation and diff on synthetic schemas."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("output_path", help="Path to write the JSON results to.")
+    run_parser.add_argument(
+        "--axes",
+        default=",".join(DEFAULT_LEVELS),
+        help="Comma separated axes to run (default: all).",
+    )
+    for axis in ("depth", "width", "refs"):
+        run_parser.add_argument(
+            f"--{axis}",
+            help=f"Comma separated {axis} levels (default: "
+            f"{','.join(map(str, DEFAULT_LEVELS[axis]))}).",
+        )
+    run_parser.add_argument(
+        "--sizes", help="Comma separated schema sizes (default: 1KB,1MB,10MB,50MB)."
+    )
+    run_parser.add_argument(
+        "--counts",
+        default=",".join(map(str, DEFAULT_COUNTS)),
+        help="Comma separated schema pair counts per case (default: 1,10).",
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=1, help="Timing runs per case (default: 1)."
+    )
+    run_parser.add_argument(
+        "--skip-memory", action="store_true", help="Do not measure peak memory."
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag regressions between two benchmark runs."
+    )
+    compare_parser.add_argument("baseline_path", help="Path to the earlier results.")
+    compare_parser.add_argument("current_path", help="Path to the later results.")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative growth before flagging (default: 0.2).",
+    )
+    compare_parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.001,
+        help="Ignore timing changes smaller than this (default: 0.001).",
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        overrides = {
+            "depth": args.depth,
+            "width": args.width,
+            "refs": args.refs,
+            "size": args.sizes,
+        }
+        levels = {}
+        for axis in parse_list(args.axes, str.strip):
+            if axis not in GENERATORS:
+                parser.error(f"Unknown axis: {axis}")
+            parse = parse_size if axis == "size" else int
+            levels[axis] = (
+                parse_list(overrides[axis], parse)
+                if overrides[axis]
+                else DEFAULT_LEVELS[axis]
+            )
+        results = run_benchmarks(
+            levels, parse_list(args.counts), args.repeat, not args.skip_memory
+        )
+        with open(args.output_path, "w") as file:
+            json.dump(results, file, indent=4)
+        print(f"Benchmark results written to: {args.output_path}")
+    else:
+        with open(args.baseline_path, "r") as file:
+            baseline = json.load(file)
+        with open(args.current_path, "r") as file:
+            current = json.load(file)
+        regressions = compare_results(
+            baseline, current, args.threshold, args.min_seconds
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions found.")
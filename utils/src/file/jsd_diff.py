@@ -2,13 +2,28 @@ import argparse
 import difflib
 import json
 
+try:
+    from .jsd_profile import (
+        StageProfiler,
+        add_profile_arguments,
+        output_profile,
+        profiler_from_args,
+    )
+except ImportError:
+    from jsd_profile import (
+        StageProfiler,
+        add_profile_arguments,
+        output_profile,
+        profiler_from_args,
+    )
+
 
 class JSDDiff:
     """
     A class to perform a diff between two JSON Schema Definition (JSD) files.
     """
 
-    def __init__(self, source_path, destination_path):
+    def __init__(self, source_path, destination_path, profiler=None):
         """
         Initialize the JSDDiff with paths to the source and destination schema files.
 
@@ -18,9 +33,12 @@ class JSDDiff:
             The path to the source JSON schema src.
         destination_path : str
             The path to the destination JSON schema src.
+        profiler : StageProfiler, optional
+            The profiler to record stage timings with (default is a disabled one).
         """
         self.source_path = source_path
         self.destination_path = destination_path
+        self.profiler = profiler if profiler is not None else StageProfiler()
         self.source_schema = None
         self.destination_schema = None
 
@@ -46,8 +64,11 @@ class JSDDiff:
             If there is an error decoding the JSON src.
         """
         try:
-            with open(path, "r") as file:
-                return json.load(file)
+            with self.profiler.stage("load", path):
+                with open(path, "r") as file:
+                    content = file.read()
+            with self.profiler.stage("parse", path):
+                return json.loads(content)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {path}")
         except json.JSONDecodeError as e:
@@ -61,20 +82,22 @@ class JSDDiff:
         self.destination_schema = self.load_jsd(self.destination_path)
 
     def perform_diff(self):
-        source_json = json.dumps(self.source_schema, indent=4) + "\n"
-        dest_json = json.dumps(self.destination_schema, indent=4) + "\n"
-
-        source_lines = source_json.splitlines(True)
-        dest_lines = dest_json.splitlines(True)
-
-        diff = difflib.unified_diff(
-            source_lines,
-            dest_lines,
-            fromfile=self.source_path,
-            tofile=self.destination_path,
-        )
+        with self.profiler.stage("dumps"):
+            source_json = json.dumps(self.source_schema, indent=4) + "\n"
+            dest_json = json.dumps(self.destination_schema, indent=4) + "\n"
+
+            source_lines = source_json.splitlines(True)
+            dest_lines = dest_json.splitlines(True)
+
+        with self.profiler.stage("diff"):
+            diff = difflib.unified_diff(
+                source_lines,
+                dest_lines,
+                fromfile=self.source_path,
+                tofile=self.destination_path,
+            )
 
-        return list(diff)
+            return list(diff)
 
     def output_diff(self, differences, output_format="text"):
         """
@@ -87,10 +110,11 @@ class JSDDiff:
         output_format : str, optional
             The format to output the differences (default is "text").
         """
-        if output_format == "html":
-            self.output_diff_html(differences)
-        else:
-            self.output_diff_text(differences)
+        with self.profiler.stage("output"):
+            if output_format == "html":
+                self.output_diff_html(differences)
+            else:
+                self.output_diff_text(differences)
 
     def output_diff_text(self, differences):
         """
@@ -144,12 +168,17 @@ if __name__ == "__main__":
         default="text",
         help="Output format for the differences (default: text).",
     )
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
-    jsd_diff = JSDDiff(args.source_path, args.destination_path)
+    profiler = profiler_from_args(args, [args.source_path, args.destination_path])
+    jsd_diff = JSDDiff(args.source_path, args.destination_path, profiler)
+    profiler.start()
     try:
         jsd_diff.load_schemas()
         differences = jsd_diff.perform_diff()
         jsd_diff.output_diff(differences, args.output_format)
     except Exception as e:
         print(f"An error occurred: {e}")
+    finally:
+        output_profile(profiler, args)
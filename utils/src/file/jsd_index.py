@@ -0,0 +1,445 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+SCHEMA_SUFFIXES = (".json", ".jsd")
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER,
+    size INTEGER,
+    root_hash BLOB
+);
+CREATE TABLE IF NOT EXISTS pointers (
+    id INTEGER PRIMARY KEY,
+    pointer TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS file_changes (
+    snapshot INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (snapshot, file_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS nodes (
+    file_id INTEGER NOT NULL,
+    pointer_id INTEGER NOT NULL,
+    valid_from INTEGER NOT NULL,
+    valid_to INTEGER,
+    hash BLOB NOT NULL,
+    PRIMARY KEY (file_id, pointer_id, valid_from)
+) WITHOUT ROWID;
+"""
+
+
+def escape_pointer_token(token):
+    """
+    Escape a single JSON Pointer reference token (RFC 6901).
+
+    Parameters:
+    ----------
+    token : str
+        The object key or array index to escape.
+
+    Returns:
+    -------
+    str
+        The escaped token.
+    """
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def subtree_hashes(schema):
+    """
+    Compute a hash for every subtree of a JSON document.
+
+    Hashes are built bottom-up (Merkle style) from the canonical form of each
+    node, so object key order and whitespace do not affect the result and each
+    node is only visited once.
+
+    Parameters:
+    ----------
+    schema : object
+        The loaded JSON document.
+
+    Returns:
+    -------
+    dict
+        A mapping of JSON Pointer (``""`` for the root) to a 16 byte digest.
+    """
+    hashes = {}
+
+    def visit(node, pointer):
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(node, dict):
+            digest.update(b"o")
+            for key in sorted(node):
+                child = visit(node[key], f"{pointer}/{escape_pointer_token(key)}")
+                digest.update(json.dumps(key).encode("utf-8"))
+                digest.update(child)
+        elif isinstance(node, list):
+            digest.update(b"a")
+            for index, item in enumerate(node):
+                digest.update(visit(item, f"{pointer}/{index}"))
+        else:
+            digest.update(b"v")
+            digest.update(json.dumps(node).encode("utf-8"))
+        hashes[pointer] = digest.digest()
+        return hashes[pointer]
+
+    visit(schema, "")
+    return hashes
+
+
+class JSDIndex:
+    """
+    A SQLite backed fingerprint index of JSON Schema Definition (JSD) files.
+
+    Each update records a snapshot. Subtree hashes are versioned by the
+    snapshots they are valid for, so the changes between two snapshots can be
+    read without touching unchanged schemas.
+    """
+
+    def __init__(self, index_path):
+        """
+        Initialize the JSDIndex with the path to the index src.
+
+        Parameters:
+        ----------
+        index_path : str
+            The path to the SQLite index src. It is created if missing.
+        """
+        self.index_path = index_path
+        self.connection = sqlite3.connect(index_path)
+        self.connection.executescript(_DDL)
+
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def load_jsd(self, path):
+        """
+        Load the JSD src.
+
+        Parameters:
+        ----------
+        path : str
+            The path to the JSON schema src.
+
+        Returns:
+        -------
+        dict
+            The loaded JSON schema.
+
+        Raises:
+        ------
+        FileNotFoundError
+            If the src at the given path does not exist.
+        ValueError
+            If there is an error decoding the JSON src.
+        """
+        try:
+            with open(path, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Error decoding JSON in {path}: {e}")
+
+    def latest_snapshot(self):
+        """
+        Return the id of the most recent snapshot, or 0 if the index is empty.
+        """
+        row = self.connection.execute("SELECT MAX(id) FROM snapshots").fetchone()
+        return row[0] or 0
+
+    def update(self, paths, prune_dirs=()):
+        """
+        Record a new snapshot of the given schema files.
+
+        Files whose size and modification time are unchanged since the last
+        snapshot are not re-read, so only the files that changed need to be
+        passed. Indexed files are only treated as deleted when they are under
+        one of ``prune_dirs`` and missing from ``paths``.
+
+        Parameters:
+        ----------
+        paths : iterable of str
+            The paths of the schema files to index.
+        prune_dirs : iterable of str, optional
+            Directories whose complete contents are listed in ``paths``
+            (default is none, so nothing is deleted).
+
+        Returns:
+        -------
+        int
+            The id of the new snapshot.
+        """
+        paths = {os.path.abspath(path) for path in paths}
+        prune_dirs = [os.path.abspath(directory) for directory in prune_dirs]
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO snapshots (created_at) VALUES (?)",
+                (datetime.now(timezone.utc).isoformat(),),
+            )
+            snapshot = cursor.lastrowid
+            rows = self.connection.execute(
+                "SELECT path, id, mtime_ns, size, root_hash FROM files "
+                "WHERE root_hash IS NOT NULL"
+            )
+            known = {path: tuple(row) for path, *row in rows}
+
+            for path in sorted(paths):
+                stat = os.stat(path)
+                previous = known.get(path)
+                if previous and previous[1:3] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                hashes = subtree_hashes(self.load_jsd(path))
+                self.connection.execute(
+                    "INSERT INTO files (path, mtime_ns, size, root_hash) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT (path) DO UPDATE SET "
+                    "mtime_ns = excluded.mtime_ns, size = excluded.size, "
+                    "root_hash = excluded.root_hash",
+                    (path, stat.st_mtime_ns, stat.st_size, hashes[""]),
+                )
+                file_id = self.connection.execute(
+                    "SELECT id FROM files WHERE path = ?", (path,)
+                ).fetchone()[0]
+                if not previous or previous[3] != hashes[""]:
+                    self._replace_nodes(file_id, hashes, snapshot)
+
+            for path in known.keys() - paths:
+                if not any(_is_under(path, directory) for directory in prune_dirs):
+                    continue
+                file_id = known[path][0]
+                self._replace_nodes(file_id, {}, snapshot)
+                self.connection.execute(
+                    "UPDATE files SET mtime_ns = NULL, size = NULL, root_hash = NULL "
+                    "WHERE id = ?",
+                    (file_id,),
+                )
+        return snapshot
+
+    def _nodes_at(self, file_id, snapshot=None):
+        """
+        Return the pointer to hash mapping of a schema at a snapshot, or its
+        live rows if ``snapshot`` is None.
+        """
+        query = (
+            "SELECT pointers.pointer, nodes.hash FROM nodes "
+            "JOIN pointers ON pointers.id = nodes.pointer_id WHERE nodes.file_id = ? "
+        )
+        if snapshot is None:
+            rows = self.connection.execute(
+                query + "AND nodes.valid_to IS NULL", (file_id,)
+            )
+        else:
+            rows = self.connection.execute(
+                query + "AND nodes.valid_from <= ? "
+                "AND (nodes.valid_to IS NULL OR nodes.valid_to > ?)",
+                (file_id, snapshot, snapshot),
+            )
+        return dict(rows)
+
+    def _pointer_id(self, pointer):
+        """
+        Return the id of a JSON Pointer, adding it to the pointers table if new.
+        """
+        row = self.connection.execute(
+            "SELECT id FROM pointers WHERE pointer = ?", (pointer,)
+        ).fetchone()
+        if row:
+            return row[0]
+        return self.connection.execute(
+            "INSERT INTO pointers (pointer) VALUES (?)", (pointer,)
+        ).lastrowid
+
+    def _replace_nodes(self, file_id, hashes, snapshot):
+        """
+        Close the live rows of a schema that differ from ``hashes``, insert
+        the new ones valid from ``snapshot`` and log the schema as changed.
+        """
+        live = self._nodes_at(file_id)
+        stale = [
+            (snapshot, file_id, self._pointer_id(pointer))
+            for pointer, digest in live.items()
+            if hashes.get(pointer) != digest
+        ]
+        fresh = [
+            (file_id, self._pointer_id(pointer), snapshot, digest)
+            for pointer, digest in hashes.items()
+            if live.get(pointer) != digest
+        ]
+        self.connection.executemany(
+            "UPDATE nodes SET valid_to = ? "
+            "WHERE file_id = ? AND pointer_id = ? AND valid_to IS NULL",
+            stale,
+        )
+        self.connection.executemany(
+            "INSERT INTO nodes (file_id, pointer_id, valid_from, hash) "
+            "VALUES (?, ?, ?, ?)",
+            fresh,
+        )
+        self.connection.execute(
+            "INSERT OR IGNORE INTO file_changes (snapshot, file_id) VALUES (?, ?)",
+            (snapshot, file_id),
+        )
+
+    def changes(self, from_snapshot, to_snapshot=None):
+        """
+        Return the schemas and JSON Pointer paths that changed between two
+        snapshots.
+
+        Only schemas logged as changed between the two snapshots are read, so
+        the cost is proportional to the number of changes rather than the
+        catalog size. Subtrees that changed and then changed back are not
+        reported.
+
+        Parameters:
+        ----------
+        from_snapshot : int
+            The id of the older snapshot (0 for an empty catalog).
+        to_snapshot : int, optional
+            The id of the newer snapshot (default is the latest snapshot).
+
+        Returns:
+        -------
+        dict
+            A mapping of schema path to the sorted list of changed pointers.
+            Ancestors of a changed node are included, ``""`` being the root.
+        """
+        if to_snapshot is None:
+            to_snapshot = self.latest_snapshot()
+        if from_snapshot > to_snapshot:
+            raise ValueError(
+                f"Snapshot {from_snapshot} is newer than snapshot {to_snapshot}"
+            )
+        candidates = self.connection.execute(
+            "SELECT DISTINCT files.id, files.path FROM file_changes "
+            "JOIN files ON files.id = file_changes.file_id "
+            "WHERE file_changes.snapshot > ? AND file_changes.snapshot <= ?",
+            (from_snapshot, to_snapshot),
+        ).fetchall()
+
+        changed = {}
+        for file_id, path in candidates:
+            before = self._nodes_at(file_id, from_snapshot)
+            after = self._nodes_at(file_id, to_snapshot)
+            pointers = [
+                pointer
+                for pointer in before.keys() | after.keys()
+                if before.get(pointer) != after.get(pointer)
+            ]
+            if pointers:
+                changed[path] = sorted(pointers)
+        return dict(sorted(changed.items()))
+
+
+def _is_under(path, directory):
+    """
+    Return whether ``path`` is inside ``directory``.
+    """
+    return os.path.commonpath([path, directory]) == directory
+
+
+def find_schema_files(paths):
+    """
+    Expand files and directories into the list of schema files they contain.
+
+    Parameters:
+    ----------
+    paths : iterable of str
+        Schema files or directories to search recursively.
+
+    Returns:
+    -------
+    list
+        The schema src paths, ending in one of ``SCHEMA_SUFFIXES``.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                found.extend(
+                    os.path.join(root, name)
+                    for name in names
+                    if name.endswith(SCHEMA_SUFFIXES)
+                )
+        else:
+            found.append(path)
+    return sorted(found)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Maintain a fingerprint index of JSD schema files and report changes."
+    )
+    parser.add_argument("index_path", help="Path to the SQLite index src.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    update_parser = subparsers.add_parser(
+        "update", help="Record a new snapshot of the schema catalog."
+    )
+    update_parser.add_argument(
+        "paths", nargs="+", help="Schema files or directories to index."
+    )
+    update_parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Treat indexed schemas missing from the given directories as deleted.",
+    )
+
+    changes_parser = subparsers.add_parser(
+        "changes", help="List schemas and paths changed between two snapshots."
+    )
+    changes_parser.add_argument(
+        "--from",
+        dest="from_snapshot",
+        type=int,
+        default=None,
+        help="Older snapshot id (default: the one before --to).",
+    )
+    changes_parser.add_argument(
+        "--to",
+        dest="to_snapshot",
+        type=int,
+        default=None,
+        help="Newer snapshot id (default: the latest snapshot).",
+    )
+    args = parser.parse_args()
+
+    try:
+        with JSDIndex(args.index_path) as index:
+            if args.command == "update":
+                prune_dirs = (
+                    [path for path in args.paths if os.path.isdir(path)]
+                    if args.prune
+                    else []
+                )
+                snapshot = index.update(find_schema_files(args.paths), prune_dirs)
+                print(f"Snapshot {snapshot} written to: {args.index_path}")
+            else:
+                to_snapshot = args.to_snapshot
+                if to_snapshot is None:
+                    to_snapshot = index.latest_snapshot()
+                from_snapshot = args.from_snapshot
+                if from_snapshot is None:
+                    from_snapshot = max(to_snapshot - 1, 0)
+                print(json.dumps(index.changes(from_snapshot, to_snapshot), indent=4))
+    except Exception as e:
+        print(f"An error occurred: {e}")
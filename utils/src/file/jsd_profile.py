@@ -0,0 +1,286 @@
+import cProfile
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+
+def peak_rss_bytes():
+    """
+    Return the peak resident set size of the current process.
+
+    Returns:
+    -------
+    int or None
+        The peak RSS in bytes, or None where the platform does not report it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageProfiler:
+    """
+    A class to time the stages of a JSD command and track its peak memory.
+
+    A disabled profiler is a no-op, so the JSD classes can call ``stage``
+    unconditionally. Stage timings are only free of instrumentation overhead
+    when neither ``track_memory`` nor ``cprofile_path`` is set; the report
+    lists the instrumentation that was active.
+    """
+
+    def __init__(
+        self, enabled=False, cprofile_path=None, track_memory=False, inputs=None
+    ):
+        """
+        Initialize the StageProfiler.
+
+        Parameters:
+        ----------
+        enabled : bool, optional
+            Whether stage timings and peak memory are recorded (default is False).
+        cprofile_path : str, optional
+            Where to dump cProfile stats when the profiler stops (default is None).
+        track_memory : bool, optional
+            Whether to trace Python allocations with tracemalloc to report peak
+            traced memory. This slows every stage down (default is False).
+        inputs : list of str, optional
+            The schema paths the command runs on, included in the report.
+        """
+        self.enabled = enabled or cprofile_path is not None or track_memory
+        self.cprofile_path = cprofile_path
+        self.track_memory = track_memory
+        self.inputs = list(inputs or [])
+        self.timings = {}
+        self.input_timings = {}
+        self.last_stage = None
+        self.peak_memory_bytes = None
+        self.peak_rss_bytes = None
+        self.total_seconds = None
+        self._profile = None
+        self._started_at = None
+        self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name, path=None):
+        """
+        Time the enclosed block and add it to the timing of the named stage.
+
+        Parameters:
+        ----------
+        name : str
+            The stage name, e.g. "load" or "diff".
+        path : str, optional
+            The schema src the stage works on, to also time it per input.
+        """
+        if not self.enabled:
+            yield
+            return
+        self.last_stage = name
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+            if path is not None:
+                timings = self.input_timings.setdefault(path, {})
+                timings[name] = timings.get(name, 0.0) + elapsed
+
+    def instrumentation(self):
+        """
+        Return the names of the active tools that inflate stage timings.
+        """
+        active = []
+        if self.track_memory:
+            active.append("tracemalloc")
+        if self.cprofile_path:
+            active.append("cProfile")
+        return active
+
+    def start(self):
+        """
+        Start tracking memory and cProfile if requested.
+        """
+        if not self.enabled:
+            return
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.track_memory:
+            tracemalloc.reset_peak()
+        if self.cprofile_path:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._started_at = time.perf_counter()
+
+    def stop(self):
+        """
+        Stop tracking and dump the cProfile stats if requested.
+        """
+        if not self.enabled or self._started_at is None:
+            return
+        self.total_seconds = time.perf_counter() - self._started_at
+        if self._profile:
+            self._profile.disable()
+            self._profile.dump_stats(self.cprofile_path)
+            self._profile = None
+        if self.track_memory:
+            self.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        self.peak_rss_bytes = peak_rss_bytes()
+        self._started_at = None
+
+    def report(self):
+        """
+        Return the recorded timings and peak memory.
+
+        Returns:
+        -------
+        dict
+            The inputs, the stage timings in seconds in the order they first
+            ran, the same timings per input where known, the total time, the
+            peak traced memory and peak process RSS in bytes, and the
+            instrumentation that was active while timing.
+        """
+        return {
+            "inputs": list(self.inputs),
+            "stages": dict(self.timings),
+            "stages_by_input": {
+                path: dict(timings) for path, timings in self.input_timings.items()
+            },
+            "total_seconds": self.total_seconds,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "instrumented": self.instrumentation(),
+        }
+
+    def output_report(self, file=sys.stderr):
+        """
+        Output the report as text.
+
+        Parameters:
+        ----------
+        file : file-like object, optional
+            Where to write the report (default is stderr).
+        """
+        print(f"Profile: {', '.join(self.inputs)}".rstrip(), file=file)
+        for name, seconds in self.timings.items():
+            print(f"  {name:<14}{seconds * 1000:10.3f} ms", file=file)
+        if self.total_seconds is not None:
+            print(f"  {'total':<14}{self.total_seconds * 1000:10.3f} ms", file=file)
+        if self.peak_memory_bytes is not None:
+            peak_mib = self.peak_memory_bytes / (1024 * 1024)
+            print(f"  {'peak traced':<14}{peak_mib:10.3f} MiB", file=file)
+        if self.peak_rss_bytes is not None:
+            peak_mib = self.peak_rss_bytes / (1024 * 1024)
+            print(f"  {'peak RSS':<14}{peak_mib:10.3f} MiB", file=file)
+        if len(self.input_timings) > 1:
+            for path, timings in self.input_timings.items():
+                stages = ", ".join(
+                    f"{name} {seconds * 1000:.3f} ms"
+                    for name, seconds in timings.items()
+                )
+                print(f"  {path}: {stages}", file=file)
+        if self.instrumentation():
+            print(
+                f"  Timings include {' and '.join(self.instrumentation())} overhead.",
+                file=file,
+            )
+        if self.cprofile_path:
+            print(f"  cProfile stats written to: {self.cprofile_path}", file=file)
+
+    def output_json(self, file_path):
+        """
+        Output the report as JSON.
+
+        Parameters:
+        ----------
+        file_path : str
+            The path to write the JSON report to.
+        """
+        with open(file_path, "w") as file:
+            json.dump(self.report(), file, indent=4)
+
+
+def add_profile_arguments(parser):
+    """
+    Add the profiling options shared by the JSD command line tools.
+
+    Parameters:
+    ----------
+    parser : argparse.ArgumentParser
+        The parser to add the options to.
+    """
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report per-stage timings and peak memory on stderr.",
+    )
+    parser.add_argument(
+        "--timings-json",
+        metavar="PATH",
+        help="Write per-stage timings and peak memory as JSON to PATH.",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also report peak traced Python memory (slows down the stages).",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="PATH",
+        help="Dump cProfile stats to PATH (viewable with pstats, snakeviz or flameprof).",
+    )
+
+
+def profiler_from_args(args, inputs=None):
+    """
+    Build a StageProfiler from the options added by add_profile_arguments.
+
+    Parameters:
+    ----------
+    args : argparse.Namespace
+        The parsed command line arguments.
+    inputs : list of str, optional
+        The schema paths the command runs on.
+
+    Returns:
+    -------
+    StageProfiler
+        The profiler, enabled if any profiling option was given.
+    """
+    return StageProfiler(
+        enabled=args.profile or args.timings_json is not None,
+        cprofile_path=args.cprofile,
+        track_memory=args.trace_memory,
+        inputs=inputs,
+    )
+
+
+def output_profile(profiler, args):
+    """
+    Stop the profiler and output its report as requested on the command line.
+
+    Parameters:
+    ----------
+    profiler : StageProfiler
+        The profiler to stop.
+    args : argparse.Namespace
+        The parsed command line arguments.
+    """
+    profiler.stop()
+    if args.profile:
+        profiler.output_report()
+    if args.timings_json:
+        profiler.output_json(args.timings_json)
@@ -3,13 +3,28 @@ import json
 
 import jsonschema
 
+try:
+    from .jsd_profile import (
+        StageProfiler,
+        add_profile_arguments,
+        output_profile,
+        profiler_from_args,
+    )
+except ImportError:
+    from jsd_profile import (
+        StageProfiler,
+        add_profile_arguments,
+        output_profile,
+        profiler_from_args,
+    )
+
 
 class JSDValidator:
     """
     A class to validate JSON Schema Definition (JSD) files.
     """
 
-    def __init__(self, schema_path):
+    def __init__(self, schema_path, profiler=None):
         """
         Initialize the JSDValidator with the path to the schema src.
 
@@ -17,8 +32,11 @@ class JSDValidator:
         ----------
         schema_path : str
             The path to the JSON schema src.
+        profiler : StageProfiler, optional
+            The profiler to record stage timings with (default is a disabled one).
         """
         self.schema_path = schema_path
+        self.profiler = profiler if profiler is not None else StageProfiler()
         self.validator_class = jsonschema.Draft7Validator
         self.schema = None
 
@@ -34,8 +52,11 @@ class JSDValidator:
             If there is an error decoding the JSON src.
         """
         try:
-            with open(self.schema_path, "r") as file:
-                self.schema = json.load(file)
+            with self.profiler.stage("load", self.schema_path):
+                with open(self.schema_path, "r") as file:
+                    content = file.read()
+            with self.profiler.stage("parse", self.schema_path):
+                self.schema = json.loads(content)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {self.schema_path}")
         except json.JSONDecodeError as e:
@@ -56,7 +77,8 @@ class JSDValidator:
             If there is a schema error in the JSON src.
         """
         try:
-            self.validator_class.check_schema(self.schema)
+            with self.profiler.stage("check_schema", self.schema_path):
+                self.validator_class.check_schema(self.schema)
             return True, f"{self.schema_path} is a valid JSON schema."
         except jsonschema.exceptions.SchemaError as e:
             return False, f"Schema error in {self.schema_path}: {e.message}"
@@ -72,21 +94,27 @@ class JSDValidator:
         message : str
             The validation message.
         """
-        if valid:
-            print(f"Validation successful: {message}")
-        else:
-            print(f"Validation failed: {message}")
+        with self.profiler.stage("output"):
+            if valid:
+                print(f"Validation successful: {message}")
+            else:
+                print(f"Validation failed: {message}")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Validate a JSD schema src.")
     parser.add_argument("schema_path", help="Path to the JSD schema src.")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
-    validator = JSDValidator(args.schema_path)
+    profiler = profiler_from_args(args, [args.schema_path])
+    validator = JSDValidator(args.schema_path, profiler)
+    profiler.start()
     try:
         validator.load_jsd()
         valid, message = validator.validate_jsd()
         validator.output_result(valid, message)
     except Exception as e:
         print(f"An error occurred: {e}")
+    finally:
+        output_profile(profiler, args)
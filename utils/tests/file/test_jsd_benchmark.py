@@ -0,0 +1,184 @@
+import json
+import os
+import sys
+import tracemalloc
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add the benchmarks directory to the Python path
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../benchmarks/file")),
+)
+import jsd_benchmark
+from jsd_benchmark import (
+    compare_results,
+    deep_schema,
+    parse_size,
+    refs_schema,
+    run_case,
+    sized_schema,
+    wide_schema,
+)
+
+
+def make_case(stages, peak_memory_bytes=1000, error=None, error_stage=None):
+    """
+    Build a case result for the comparison tests.
+    """
+    return {
+        "axis": "width",
+        "level": 10,
+        "count": 1,
+        "stages": stages,
+        "peak_memory_bytes": peak_memory_bytes,
+        "error": error,
+        "error_stage": error_stage,
+    }
+
+
+class TestGenerators:
+    """
+    Test suite for the synthetic schema generators.
+    """
+
+    def test_deep_schema(self):
+        schema = deep_schema(3)
+        for level in (2, 1, 0):
+            schema = schema["properties"][f"level_{level}"]
+        assert schema == {"type": "string"}
+
+    def test_wide_schema(self):
+        assert len(wide_schema(25)["properties"]) == 25
+
+    def test_refs_schema(self):
+        schema = refs_schema(5)
+        assert len(schema["definitions"]) == 5
+        assert schema["properties"]["field_4"] == {"$ref": "#/definitions/def_4"}
+
+    def test_sized_schema(self):
+        size = len(json.dumps(sized_schema(64 * 1024), indent=4))
+        assert 0.9 * 64 * 1024 <= size <= 1.1 * 64 * 1024
+
+
+class TestRunCase:
+    """
+    Test suite for the run_case function.
+    """
+
+    def test_stages_are_timed(self):
+        result = run_case("width", 10, 2)
+        assert result["error"] is None
+        assert list(result["stages"]) == [
+            "load",
+            "parse",
+            "check_schema",
+            "dumps",
+            "diff",
+        ]
+        assert result["schema_bytes"] > 0
+        assert result["peak_memory_bytes"] > 0
+
+    def test_timing_runs_are_not_traced(self):
+        traced = []
+
+        def run_pairs(pairs, profiler):
+            profiler.start()
+            with profiler.stage("load"):
+                traced.append(tracemalloc.is_tracing())
+            profiler.stop()
+
+        with patch.object(jsd_benchmark, "run_pairs", side_effect=run_pairs):
+            result = run_case("width", 10, 1, repeat=3)
+        assert traced == [False, False, False, True]
+        assert result["peak_memory_bytes"] is not None
+
+    def test_tooling_errors_are_recorded(self):
+        result = run_case("depth", 200, 1)
+        assert result["error"].startswith("RecursionError")
+        assert result["error_stage"] == "check_schema"
+        assert list(result["stages"]) == ["load", "parse", "check_schema"]
+        assert result["total_seconds"] == sum(result["stages"].values())
+        assert result["peak_memory_bytes"] is None
+
+    def test_generation_errors_are_recorded(self):
+        generator = Mock(side_effect=RecursionError("too deep"))
+        with patch.dict(jsd_benchmark.GENERATORS, {"depth": generator}):
+            result = run_case("depth", 10, 1)
+        assert result["error"] == "RecursionError: too deep"
+        assert result["error_stage"] == "generate"
+        assert result["stages"] == {}
+
+
+class TestCompareResults:
+    """
+    Test suite for the compare_results function.
+    """
+
+    def test_slower_stage_is_flagged(self):
+        baseline = {"cases": [make_case({"diff": 0.1, "parse": 0.1})]}
+        current = {"cases": [make_case({"diff": 0.2, "parse": 0.11})]}
+        regressions = compare_results(baseline, current)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("width=10 x1: diff")
+
+    def test_noise_is_ignored(self):
+        baseline = {"cases": [make_case({"diff": 0.0001})]}
+        current = {"cases": [make_case({"diff": 0.0005})]}
+        assert compare_results(baseline, current) == []
+
+    def test_memory_growth_is_flagged(self):
+        baseline = {"cases": [make_case({}, peak_memory_bytes=1000)]}
+        current = {"cases": [make_case({}, peak_memory_bytes=2000)]}
+        assert len(compare_results(baseline, current)) == 1
+
+    def test_new_failure_is_flagged(self):
+        baseline = {"cases": [make_case({"diff": 0.1})]}
+        current = {
+            "cases": [
+                make_case(
+                    {"load": 0.1},
+                    error="RecursionError: too deep",
+                    error_stage="check_schema",
+                )
+            ]
+        }
+        assert compare_results(baseline, current) == [
+            "width=10 x1: now fails in check_schema with RecursionError: too deep"
+        ]
+
+    def test_missing_stage_is_flagged(self):
+        error = "RecursionError: too deep"
+        baseline = {
+            "cases": [
+                make_case(
+                    {"load": 0.1, "check_schema": 0.1},
+                    error=error,
+                    error_stage="check_schema",
+                )
+            ]
+        }
+        current = {
+            "cases": [make_case({"load": 0.1}, error=error, error_stage="load")]
+        }
+        assert compare_results(baseline, current) == [
+            "width=10 x1: check_schema missing from the current run"
+        ]
+
+    def test_missing_case_is_flagged(self):
+        baseline = {"cases": [make_case({"diff": 0.1})]}
+        current = {"cases": []}
+        assert compare_results(baseline, current) == [
+            "width=10 x1: missing from the current run"
+        ]
+
+
+def test_parse_size():
+    assert parse_size("512") == 512
+    assert parse_size("1KB") == 1024
+    assert parse_size("50mb") == 50 * 1024 * 1024
+
+
+if __name__ == "__main__":
+    pytest.main()
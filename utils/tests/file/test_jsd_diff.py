@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 from unittest.mock import mock_open, patch
 
@@ -11,6 +12,7 @@ sys.path.insert(
 )
 
 from jsd_diff import JSDDiff
+from jsd_profile import StageProfiler
 
 
 class TestJSDDiff:
@@ -50,6 +52,26 @@ class TestJSDDiff:
         ]
         assert differences == expected_diff
 
+    @patch("builtins.open", new_callable=mock_open, read_data='{"key1": "value1"}')
+    def test_stages_are_profiled(self, mock_file):
+        profiler = StageProfiler(enabled=True)
+        jsd_diff = JSDDiff("source.jsd", "destination.jsd", profiler)
+        jsd_diff.load_schemas()
+        differences = jsd_diff.perform_diff()
+        jsd_diff.output_diff(differences)
+        assert list(profiler.timings) == ["load", "parse", "dumps", "diff", "output"]
+        assert list(profiler.input_timings) == ["source.jsd", "destination.jsd"]
+
+    def test_import_as_package(self):
+        repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+        result = subprocess.run(
+            [sys.executable, "-c", "import utils.src.file.jsd_diff"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
     @patch("builtins.open", new_callable=mock_open)
     def test_output_diff_text(self, mock_file):
         jsd_diff = JSDDiff("source.jsd", "destination.jsd")
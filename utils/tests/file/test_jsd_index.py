@@ -0,0 +1,192 @@
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/file")),
+)
+from jsd_index import JSDIndex, find_schema_files, subtree_hashes
+
+
+def write_schema(path, schema, mtime_ns):
+    """
+    Write a schema src and pin its modification time.
+    """
+    path.write_text(json.dumps(schema))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+class TestSubtreeHashes:
+    """
+    Test suite for the subtree_hashes function.
+    """
+
+    def test_key_order_does_not_matter(self):
+        first = subtree_hashes({"a": 1, "b": {"c": [1, 2]}})
+        second = subtree_hashes({"b": {"c": [1, 2]}, "a": 1})
+        assert first == second
+
+    def test_pointers_are_escaped(self):
+        hashes = subtree_hashes({"a/b": {"c~d": [True]}})
+        assert set(hashes) == {"", "/a~1b", "/a~1b/c~0d", "/a~1b/c~0d/0"}
+
+    def test_types_are_distinguished(self):
+        assert subtree_hashes("1")[""] != subtree_hashes(1)[""]
+        assert subtree_hashes([])[""] != subtree_hashes({})[""]
+
+
+class TestJSDIndex:
+    """
+    Test suite for the JSDIndex class.
+    """
+
+    def test_changes_between_snapshots(self, tmp_path):
+        orders = write_schema(
+            tmp_path / "orders.jsd",
+            {"type": "object", "properties": {"id": {"type": "string"}}},
+            1,
+        )
+        users = write_schema(tmp_path / "users.jsd", {"type": "object"}, 1)
+
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            first = index.update([orders, users])
+            assert index.changes(0, first) == {
+                orders: [
+                    "",
+                    "/properties",
+                    "/properties/id",
+                    "/properties/id/type",
+                    "/type",
+                ],
+                users: ["", "/type"],
+            }
+
+            write_schema(
+                tmp_path / "orders.jsd",
+                {"type": "object", "properties": {"id": {"type": "integer"}}},
+                2,
+            )
+            second = index.update([orders, users])
+            assert index.changes(first, second) == {
+                orders: ["", "/properties", "/properties/id", "/properties/id/type"],
+            }
+            assert index.changes(second) == {}
+
+    def test_unchanged_content_is_not_reported(self, tmp_path):
+        schema = write_schema(tmp_path / "a.jsd", {"a": 1, "b": 2}, 1)
+
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            first = index.update([schema])
+            write_schema(tmp_path / "a.jsd", {"b": 2, "a": 1}, 2)
+            second = index.update([schema])
+            assert index.changes(first, second) == {}
+
+    def test_change_reverted_is_not_reported(self, tmp_path):
+        schema = write_schema(tmp_path / "a.jsd", {"a": 1}, 1)
+
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            first = index.update([schema])
+            write_schema(tmp_path / "a.jsd", {"a": 2}, 2)
+            second = index.update([schema])
+            write_schema(tmp_path / "a.jsd", {"a": 1}, 3)
+            third = index.update([schema])
+            assert index.changes(first, third) == {}
+            assert index.changes(second, third) == {schema: ["", "/a"]}
+
+    def test_deleted_schema_is_reported(self, tmp_path):
+        kept = write_schema(tmp_path / "kept.jsd", {"a": 1}, 1)
+        removed = write_schema(tmp_path / "removed.jsd", {"b": [1]}, 1)
+
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            first = index.update([kept, removed])
+            second = index.update([kept], prune_dirs=[str(tmp_path)])
+            assert index.changes(first, second) == {removed: ["", "/b", "/b/0"]}
+
+            third = index.update([kept, removed])
+            assert index.changes(second, third) == {removed: ["", "/b", "/b/0"]}
+            assert index.changes(first, third) == {}
+
+    def test_prune_is_limited_to_given_directories(self, tmp_path):
+        (tmp_path / "orders").mkdir()
+        (tmp_path / "users").mkdir()
+        orders = write_schema(tmp_path / "orders" / "a.jsd", {"a": 1}, 1)
+        users = write_schema(tmp_path / "users" / "b.jsd", {"b": 1}, 1)
+
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            first = index.update([orders, users])
+            second = index.update([], prune_dirs=[str(tmp_path / "orders")])
+            assert index.changes(first, second) == {orders: ["", "/a"]}
+
+    def test_updating_one_file_keeps_the_others(self, tmp_path):
+        a = write_schema(tmp_path / "a.jsd", {"a": 1}, 1)
+        b = write_schema(tmp_path / "b.jsd", {"b": 1}, 1)
+
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            first = index.update([a, b])
+            write_schema(tmp_path / "a.jsd", {"a": 2}, 2)
+            second = index.update([a])
+            assert index.changes(first, second) == {a: ["", "/a"]}
+
+            write_schema(tmp_path / "b.jsd", {"b": 2}, 2)
+            third = index.update([b])
+            assert index.changes(first, third) == {a: ["", "/a"], b: ["", "/b"]}
+
+    def test_unchanged_files_are_not_read(self, tmp_path):
+        a = write_schema(tmp_path / "a.jsd", {"a": 1}, 1)
+        b = write_schema(tmp_path / "b.jsd", {"b": 1}, 1)
+
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            first = index.update([a, b])
+            write_schema(tmp_path / "b.jsd", {"b": 2}, 2)
+            with patch.object(
+                JSDIndex, "load_jsd", autospec=True, return_value={"b": 2}
+            ) as mock_load:
+                second = index.update([a, b])
+            mock_load.assert_called_once_with(index, b)
+            assert index.changes(first, second) == {b: ["", "/b"]}
+
+    def test_index_persists_between_connections(self, tmp_path):
+        schema = write_schema(tmp_path / "a.jsd", {"a": 1}, 1)
+        index_path = str(tmp_path / "index.db")
+
+        with JSDIndex(index_path) as index:
+            first = index.update([schema])
+        write_schema(tmp_path / "a.jsd", {"a": 1, "b": 2}, 2)
+        with JSDIndex(index_path) as index:
+            second = index.update([schema])
+            assert index.latest_snapshot() == second
+            assert index.changes(first) == {schema: ["", "/b"]}
+
+    def test_changes_rejects_reversed_snapshots(self, tmp_path):
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            with pytest.raises(ValueError):
+                index.changes(2, 1)
+
+    def test_load_jsd_invalid_json(self, tmp_path):
+        bad = tmp_path / "bad.jsd"
+        bad.write_text("{")
+        with JSDIndex(str(tmp_path / "index.db")) as index:
+            with pytest.raises(ValueError):
+                index.update([str(bad)])
+            assert index.latest_snapshot() == 0
+
+
+def test_find_schema_files(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "a.json").write_text("{}")
+    (tmp_path / "nested" / "b.jsd").write_text("{}")
+    (tmp_path / "notes.txt").write_text("")
+    assert find_schema_files([str(tmp_path)]) == [
+        str(tmp_path / "a.json"),
+        str(tmp_path / "nested" / "b.jsd"),
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,150 @@
+import argparse
+import io
+import json
+import os
+import pstats
+import sys
+import tracemalloc
+
+import pytest
+
+# Add the src directory to the Python path
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/file")),
+)
+from jsd_profile import (
+    StageProfiler,
+    add_profile_arguments,
+    output_profile,
+    profiler_from_args,
+)
+
+
+class TestStageProfiler:
+    """
+    Test suite for the StageProfiler class.
+    """
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = StageProfiler()
+        profiler.start()
+        with profiler.stage("load"):
+            pass
+        profiler.stop()
+        assert profiler.report() == {
+            "inputs": [],
+            "stages": {},
+            "stages_by_input": {},
+            "total_seconds": None,
+            "peak_memory_bytes": None,
+            "peak_rss_bytes": None,
+            "instrumented": [],
+        }
+
+    def test_stages_accumulate_in_order(self):
+        profiler = StageProfiler(track_memory=True)
+        profiler.start()
+        with profiler.stage("load"):
+            pass
+        with profiler.stage("parse"):
+            buffer = [0] * 10000
+        with profiler.stage("load"):
+            pass
+        profiler.stop()
+        report = profiler.report()
+        assert list(report["stages"]) == ["load", "parse"]
+        assert report["total_seconds"] >= sum(report["stages"].values())
+        assert report["peak_memory_bytes"] >= sys.getsizeof(buffer)
+        assert report["instrumented"] == ["tracemalloc"]
+        assert not tracemalloc.is_tracing()
+
+    def test_timings_are_not_traced_by_default(self):
+        profiler = StageProfiler(enabled=True)
+        profiler.start()
+        with profiler.stage("parse"):
+            assert not tracemalloc.is_tracing()
+        profiler.stop()
+        report = profiler.report()
+        assert report["peak_memory_bytes"] is None
+        assert report["instrumented"] == []
+        if sys.platform != "win32":
+            assert report["peak_rss_bytes"] > 0
+
+    def test_stages_are_timed_per_input(self):
+        profiler = StageProfiler(enabled=True, inputs=["a.jsd", "b.jsd"])
+        for path in ("a.jsd", "b.jsd"):
+            with profiler.stage("load", path):
+                pass
+            with profiler.stage("parse", path):
+                pass
+        with profiler.stage("diff"):
+            pass
+        report = profiler.report()
+        assert report["inputs"] == ["a.jsd", "b.jsd"]
+        assert list(report["stages"]) == ["load", "parse", "diff"]
+        assert list(report["stages_by_input"]) == ["a.jsd", "b.jsd"]
+        assert list(report["stages_by_input"]["b.jsd"]) == ["load", "parse"]
+
+    def test_stage_is_recorded_when_it_raises(self):
+        profiler = StageProfiler(enabled=True)
+        with pytest.raises(ValueError):
+            with profiler.stage("parse"):
+                raise ValueError("bad")
+        assert "parse" in profiler.timings
+
+    def test_cprofile_stats_are_dumped(self, tmp_path):
+        stats_path = str(tmp_path / "jsd.prof")
+        profiler = StageProfiler(cprofile_path=stats_path)
+        assert profiler.enabled
+        profiler.start()
+        json.dumps({"key": list(range(100))})
+        profiler.stop()
+        assert pstats.Stats(stats_path).total_calls > 0
+        assert profiler.report()["instrumented"] == ["cProfile"]
+
+    def test_output_report(self):
+        profiler = StageProfiler(track_memory=True, inputs=["a.jsd"])
+        profiler.timings = {"load": 0.5}
+        profiler.total_seconds = 1.0
+        profiler.peak_memory_bytes = 2 * 1024 * 1024
+        profiler.peak_rss_bytes = 4 * 1024 * 1024
+        output = io.StringIO()
+        profiler.output_report(output)
+        lines = output.getvalue().splitlines()
+        assert lines[0] == "Profile: a.jsd"
+        assert lines[1].split() == ["load", "500.000", "ms"]
+        assert lines[2].split() == ["total", "1000.000", "ms"]
+        assert lines[3].split() == ["peak", "traced", "2.000", "MiB"]
+        assert lines[4].split() == ["peak", "RSS", "4.000", "MiB"]
+        assert lines[5].strip() == "Timings include tracemalloc overhead."
+
+
+def test_timings_json_from_args(tmp_path):
+    parser = argparse.ArgumentParser()
+    add_profile_arguments(parser)
+    timings_path = str(tmp_path / "timings.json")
+    args = parser.parse_args(["--timings-json", timings_path])
+
+    profiler = profiler_from_args(args, ["a.jsd"])
+    profiler.start()
+    with profiler.stage("diff"):
+        pass
+    output_profile(profiler, args)
+
+    with open(timings_path) as file:
+        report = json.load(file)
+    assert report["inputs"] == ["a.jsd"]
+    assert list(report["stages"]) == ["diff"]
+    assert report["peak_memory_bytes"] is None
+    assert report["instrumented"] == []
+
+
+def test_profiler_from_args_disabled_by_default():
+    parser = argparse.ArgumentParser()
+    add_profile_arguments(parser)
+    assert not profiler_from_args(parser.parse_args([])).enabled
+
+
+if __name__ == "__main__":
+    pytest.main()
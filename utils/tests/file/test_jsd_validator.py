@@ -10,6 +10,7 @@ sys.path.insert(
     0,
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src/file")),
 )
+from jsd_profile import StageProfiler
 from jsd_validator import JSDValidator
 
 
@@ -95,6 +96,26 @@ class TestJSDValidator:
         assert not valid
         assert "Schema error" in message
 
+    @patch("builtins.print")
+    @patch("builtins.open", new_callable=mock_open, read_data='{"type": "object"}')
+    def test_stages_are_profiled(self, mock_file, mock_print):
+        """
+        Test that each stage of a validation is timed by the profiler.
+
+        Parameters:
+        ----------
+        mock_file : unittest.mock.MagicMock
+            Mocked src object.
+        mock_print : unittest.mock.MagicMock
+            Mocked print function.
+        """
+        profiler = StageProfiler(enabled=True)
+        validator = JSDValidator("dummy_path.jsd", profiler)
+        validator.load_jsd()
+        valid, message = validator.validate_jsd()
+        validator.output_result(valid, message)
+        assert list(profiler.timings) == ["load", "parse", "check_schema", "output"]
+
     @patch("builtins.print")
     def test_output_result_valid(self, mock_print):
         """